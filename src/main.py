@@ -6,6 +6,7 @@ from src.database import get_db, init_db, QueryLog, Feedback
 from src.data_manager import product_data_manager
 from src.vector_store import vector_store_manager
 from src.agent import get_agent, process_agent_response
+from src.tool_executor import tool_executor
 import os
 
 app = FastAPI(title="AI Product Research Assistant")
@@ -59,6 +60,11 @@ async def startup_event():
     else:
         print("Warning: products_catalog.csv not found.")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    # Release the dedicated tool thread pool
+    tool_executor.shutdown()
+
 @app.post("/query", response_model=QueryResponse)
 async def run_query(request: QueryRequest, db: Session = Depends(get_db)):
     agent = get_agent()
@@ -129,6 +135,11 @@ def submit_feedback(request: FeedbackRequest, db: Session = Depends(get_db)):
     
     return {"message": "Feedback received"}
 
+@app.get("/metrics/tools")
+def get_tool_metrics():
+    # Per-tool call counts, timeouts, errors and latency from the tool thread pool
+    return tool_executor.get_metrics()
+
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
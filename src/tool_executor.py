@@ -0,0 +1,178 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+# Per-tool timeouts (seconds). External calls get more headroom than in-memory math.
+# Override per tool with TOOL_TIMEOUT_<TOOL_NAME>, e.g. TOOL_TIMEOUT_MARKET_RESEARCH_TOOL=20.
+DEFAULT_TOOL_TIMEOUTS = {
+    "search_catalog_tool": 10.0,
+    "price_analysis_tool": 5.0,
+    "market_research_tool": 15.0,
+}
+DEFAULT_TIMEOUT = 10.0
+
+def _env_timeout(tool_name: str):
+    value = os.getenv(f"TOOL_TIMEOUT_{tool_name.upper()}")
+    return float(value) if value is not None else None
+
+class ToolExecutor:
+    """
+    Runs agent tool backends with per-tool timeouts, isolation, and metrics.
+
+    Async backends (Serper, Gemini embeddings) are awaited directly, so a timeout cancels the
+    HTTP request itself. Blocking work (Pandas, local ChromaDB queries) runs on a small thread
+    pool owned by each tool, so a slow tool can only exhaust its own workers and never starves
+    the others. A slow or failing tool returns an error payload instead of failing the turn.
+    """
+    def __init__(self, max_workers: int = None, timeouts: Dict[str, float] = None,
+                 default_timeout: float = DEFAULT_TIMEOUT):
+        if max_workers is None:
+            max_workers = int(os.getenv("TOOL_MAX_WORKERS", "4"))
+        self.max_workers = max_workers  # per tool
+        self.default_timeout = default_timeout
+        self.timeouts = dict(DEFAULT_TOOL_TIMEOUTS if timeouts is None else timeouts)
+        for name in self.timeouts:
+            override = _env_timeout(name)
+            if override is not None:
+                self.timeouts[name] = override
+        self._pools = {}
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def get_timeout(self, tool_name: str) -> float:
+        if tool_name in self.timeouts:
+            return self.timeouts[tool_name]
+        override = _env_timeout(tool_name)
+        return override if override is not None else self.default_timeout
+
+    def _get_pool(self, tool_name: str) -> ThreadPoolExecutor:
+        # Created lazily so pools can be rebuilt after shutdown() (e.g. app restarts in tests).
+        with self._lock:
+            if tool_name not in self._pools:
+                self._pools[tool_name] = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=f"tool-{tool_name}"
+                )
+            return self._pools[tool_name]
+
+    async def run(self, tool_name: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Executes a tool backend and awaits it with the tool's timeout.
+
+        `func` may be a coroutine function (awaited on the event loop) or a blocking function
+        (sent to the tool's own pool). Returns the result, or a JSON error string if the call
+        timed out or raised.
+        """
+        timeout = self.get_timeout(tool_name)
+        if asyncio.iscoroutinefunction(func):
+            call = func(*args, **kwargs)
+        else:
+            call = self.run_blocking(tool_name, func, *args, **kwargs)
+
+        self._record_start(tool_name)
+        start = time.perf_counter()
+        status = "success"
+        try:
+            return await asyncio.wait_for(call, timeout=timeout)
+        except asyncio.TimeoutError:
+            status = "timeout"
+            return json.dumps({"error": f"{tool_name} timed out after {timeout:g}s"})
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        except Exception as e:
+            status = "error"
+            return json.dumps({"error": f"{tool_name} failed: {e}"})
+        finally:
+            self._record_end(tool_name, status, time.perf_counter() - start)
+
+    async def run_blocking(self, tool_name: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Runs a blocking function on the tool's own pool.
+
+        A thread cannot be interrupted, so work abandoned by a timeout keeps its worker until
+        it returns; it is reported as `busy_workers` in the metrics until then.
+        """
+        def work():
+            self._update(tool_name, "busy_workers", 1)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._update(tool_name, "busy_workers", -1)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_pool(tool_name), work)
+
+    # --- Metrics ---
+
+    def _stats(self, tool_name: str) -> dict:
+        # Caller must hold self._lock
+        return self._metrics.setdefault(tool_name, {
+            "calls": 0,
+            "success": 0,
+            "timeout": 0,
+            "error": 0,
+            "cancelled": 0,
+            "pending": 0,
+            "busy_workers": 0,
+            "total_latency_ms": 0.0,
+            "max_latency_ms": 0.0,
+        })
+
+    def _update(self, tool_name: str, key: str, delta: int):
+        with self._lock:
+            self._stats(tool_name)[key] += delta
+
+    def _record_start(self, tool_name: str):
+        self._update(tool_name, "pending", 1)
+
+    def _record_end(self, tool_name: str, status: str, elapsed: float):
+        with self._lock:
+            stats = self._stats(tool_name)
+            elapsed_ms = elapsed * 1000
+            stats["pending"] -= 1
+            stats["calls"] += 1
+            stats[status] += 1
+            stats["total_latency_ms"] += elapsed_ms
+            stats["max_latency_ms"] = max(stats["max_latency_ms"], elapsed_ms)
+
+    def get_metrics(self) -> dict:
+        """
+        Returns a snapshot of per-tool call outcomes and latencies.
+
+        `pending` counts calls still being awaited; `busy_workers` counts pool threads still
+        running backend work, including work whose caller already timed out.
+        """
+        with self._lock:
+            tools = {}
+            for name, stats in self._metrics.items():
+                calls = stats["calls"]
+                tools[name] = {
+                    "calls": calls,
+                    "success": stats["success"],
+                    "timeout": stats["timeout"],
+                    "error": stats["error"],
+                    "cancelled": stats["cancelled"],
+                    "pending": stats["pending"],
+                    "busy_workers": stats["busy_workers"],
+                    "avg_latency_ms": round(stats["total_latency_ms"] / calls, 2) if calls else 0.0,
+                    "max_latency_ms": round(stats["max_latency_ms"], 2),
+                    "timeout_s": self.get_timeout(name),
+                }
+            return {
+                "max_workers_per_tool": self.max_workers,
+                "tools": tools,
+            }
+
+    def shutdown(self):
+        """Stops all tool pools without waiting for abandoned backend calls to finish."""
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+
+tool_executor = ToolExecutor()
@@ -1,17 +1,27 @@
 from langchain.tools import tool
 from src.vector_store import vector_store_manager
 from src.data_manager import product_data_manager
+from src.tool_executor import tool_executor
 from langchain_community.utilities import GoogleSerperAPIWrapper
+import aiohttp
 import json
 
-@tool
-def search_catalog_tool(query: str):
-    """
-    Useful for searching the product catalog for inventory, descriptions, and general product information.
-    Returns a list of matching products with their details and relevance scores.
+# --- Helper Functions ---
+
+def calculate_margin(price: float, cost: float) -> float:
     """
-    results = vector_store_manager.search(query)
+    Calculates the profit margin percentage.
     
+    Returns 0.0 if price is non-positive to prevent division errors.
+    """
+    if price <= 0: return 0.0
+    return ((price - cost) / price) * 100
+
+# --- Backends ---
+# Network calls are async so a timeout cancels the request itself; local work (Pandas,
+# ChromaDB lookups) runs on the tool's own thread pool (see src/tool_executor.py).
+
+def _format_catalog_results(results) -> str:
     formatted_results = []
     for doc, score in results:
         formatted_results.append({
@@ -27,35 +37,15 @@ def search_catalog_tool(query: str):
         
     return json.dumps(formatted_results, indent=2)
 
-# --- Helper Functions ---
-
-def calculate_margin(price: float, cost: float) -> float:
-    """
-    Calculates the profit margin percentage.
-    
-    Returns 0.0 if price is non-positive to prevent division errors.
-    """
-    if price <= 0: return 0.0
-    return ((price - cost) / price) * 100
+async def _search_catalog(query: str) -> str:
+    embedding = await vector_store_manager.aembed_query(query)
+    results = await tool_executor.run_blocking(
+        "search_catalog_tool", vector_store_manager.search_by_vector, embedding
+    )
+    return _format_catalog_results(results)
 
-# --- Unified Price Analysis Tool ---
-
-@tool
-def price_analysis_tool(action: str, threshold: float = 0.0, category: str = None, limit: int = 5, 
-                         max_price: float = None, min_rating: float = None):
-    """
-    Performs math, filtering, and statistical analysis on the product catalog.
-    
-    Args:
-        action: Type of analysis. Options: 
-                ['lowest_margin', 'below_threshold', 'category_average', 'cheapest', 
-                 'most_expensive', 'filter_products', 'exact_price']
-        threshold: Margin percentage (e.g. 49.0) for 'below_threshold'.
-        category: Category name to filter by.
-        limit: Max results to return (default 5).
-        max_price: Max price for 'filter_products' OR exact price for 'exact_price'.
-        min_rating: Minimum rating for 'filter_products'.
-    """
+def _price_analysis(action: str, threshold: float = 0.0, category: str = None, limit: int = 5,
+                    max_price: float = None, min_rating: float = None) -> str:
     df = product_data_manager.get_df().copy()
     
     # 1. Pre-calculate Margins locally
@@ -124,15 +114,54 @@ def price_analysis_tool(action: str, threshold: float = 0.0, category: str = Non
     
     return json.dumps(result, indent=2)
 
+async def _market_research(query: str) -> str:
+    # Client-side timeout on the Serper HTTP call itself
+    timeout = aiohttp.ClientTimeout(total=tool_executor.get_timeout("market_research_tool"))
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        search = GoogleSerperAPIWrapper(aiosession=session)
+        results = await search.aresults(query)
+    return json.dumps(results, indent=2)
+
+# --- Agent Tools ---
+# Async-native so independent tool calls in the same model turn run concurrently.
+# Each call is bounded by a per-tool timeout and returns an error payload instead of raising.
+
+@tool
+async def search_catalog_tool(query: str):
+    """
+    Useful for searching the product catalog for inventory, descriptions, and general product information.
+    Returns a list of matching products with their details and relevance scores.
+    """
+    return await tool_executor.run("search_catalog_tool", _search_catalog, query)
+
 @tool
-def market_research_tool(query: str):
+async def price_analysis_tool(action: str, threshold: float = 0.0, category: str = None, limit: int = 5, 
+                              max_price: float = None, min_rating: float = None):
+    """
+    Performs math, filtering, and statistical analysis on the product catalog.
+    
+    Args:
+        action: Type of analysis. Options: 
+                ['lowest_margin', 'below_threshold', 'category_average', 'cheapest', 
+                 'most_expensive', 'filter_products', 'exact_price']
+        threshold: Margin percentage (e.g. 49.0) for 'below_threshold'.
+        category: Category name to filter by.
+        limit: Max results to return (default 5).
+        max_price: Max price for 'filter_products' OR exact price for 'exact_price'.
+        min_rating: Minimum rating for 'filter_products'.
+    """
+    return await tool_executor.run(
+        "price_analysis_tool", _price_analysis,
+        action, threshold, category, limit, max_price, min_rating
+    )
+
+@tool
+async def market_research_tool(query: str):
     """
     Performs external market research using Google Search.
     Useful for gathering competitor prices, trends, and recent news not available in the internal catalog.
     """
-    search = GoogleSerperAPIWrapper()
-    results = search.results(query)
-    return json.dumps(results, indent=2)
+    return await tool_executor.run("market_research_tool", _market_research, query)
 
 # List of tools for the agent
 tools_list = [
@@ -74,4 +74,21 @@ class VectorStoreManager:
         )
         return results
 
+    async def aembed_query(self, query: str) -> List[float]:
+        """
+        Embeds a query with the async Gemini client, so a timeout cancels the request itself.
+        """
+        return await self.embeddings.aembed_query(query)
+
+    def search_by_vector(self, embedding: List[float], filter_dict: Dict[str, Any] = None, k: int = 4):
+        """
+        Same as search(), for a query that has already been embedded (local ChromaDB lookup only).
+        """
+        results = self.vector_store.similarity_search_by_vector_with_relevance_scores(
+            embedding,
+            k=k,
+            filter=filter_dict
+        )
+        return results
+
 vector_store_manager = VectorStoreManager()
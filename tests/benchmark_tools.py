@@ -0,0 +1,160 @@
+"""
+Multi-tool latency benchmark with stubbed backends.
+
+Compares the previous tools (sync @tools; LangGraph's ToolNode gathers them and LangChain
+runs them on the event loop's default executor) against the current async tools (network
+calls awaited directly, local work on per-tool pools with per-tool timeouts). ChromaDB,
+Gemini embeddings and Serper are replaced by stubs with fixed latencies, so no API keys or
+network access are needed.
+
+Scenarios:
+  1. One turn: search_catalog_tool + market_research_tool (the AudioMax example).
+  2. Many concurrent turns: the same pair from CONCURRENT_TURNS users at once.
+  3. Hung Serper: web search never returns within its timeout while many turns run.
+
+Usage (from the project root):
+    python tests/benchmark_tools.py
+"""
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark-stub")
+os.environ.setdefault("SERPER_API_KEY", "benchmark-stub")
+
+from langchain_core.tools import StructuredTool
+
+import src.tools as tools
+from src.tool_executor import tool_executor
+
+EMBED_LATENCY = 0.25    # Simulated Gemini embedding request
+LOOKUP_LATENCY = 0.05   # Simulated local ChromaDB query
+SERPER_LATENCY = 1.0    # Simulated Google Search round-trip
+HUNG_SERPER_LATENCY = 5.0
+HUNG_SERPER_TIMEOUT = 1.0
+CONCURRENT_TURNS = 40
+RUNS = 5
+QUERY = "AudioMax headphones price"
+
+class StubDoc:
+    def __init__(self):
+        self.page_content = "Product: AudioMax Pro Headphones"
+        self.metadata = {"product_id": "P001", "product_name": "AudioMax Pro Headphones", "price": 199.99}
+
+class StubVectorStore:
+    def search(self, query, filter_dict=None, k=4):
+        time.sleep(EMBED_LATENCY + LOOKUP_LATENCY)
+        return [(StubDoc(), 0.12)]
+
+    async def aembed_query(self, query):
+        await asyncio.sleep(EMBED_LATENCY)
+        return [0.0]
+
+    def search_by_vector(self, embedding, filter_dict=None, k=4):
+        time.sleep(LOOKUP_LATENCY)
+        return [(StubDoc(), 0.12)]
+
+class StubSerper:
+    latency = SERPER_LATENCY
+
+    def __init__(self, **kwargs):
+        pass
+
+    def results(self, query):
+        time.sleep(self.latency)
+        return {"organic": [{"title": f"{query} - competitor price", "price": "$189.00"}]}
+
+    async def aresults(self, query):
+        await asyncio.sleep(self.latency)
+        return {"organic": [{"title": f"{query} - competitor price", "price": "$189.00"}]}
+
+# --- Previous implementation: sync tools over the same (stubbed) backends ---
+
+def _old_search_catalog(query: str) -> str:
+    return tools._format_catalog_results(tools.vector_store_manager.search(query))
+
+def _old_market_research(query: str) -> str:
+    return json.dumps(tools.GoogleSerperAPIWrapper().results(query), indent=2)
+
+old_search_catalog_tool = StructuredTool.from_function(
+    _old_search_catalog, name="search_catalog_tool", description="Catalog search (previous sync tool)."
+)
+old_market_research_tool = StructuredTool.from_function(
+    _old_market_research, name="market_research_tool", description="Web search (previous sync tool)."
+)
+
+async def one_turn(catalog_tool, market_tool):
+    # ToolNode runs the tool calls of one model turn with asyncio.gather
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        catalog_tool.ainvoke({"query": QUERY}),
+        market_tool.ainvoke({"query": QUERY}),
+    )
+    return (time.perf_counter() - start) * 1000, results
+
+async def many_turns(catalog_tool, market_tool, turns: int):
+    return await asyncio.gather(*(one_turn(catalog_tool, market_tool) for _ in range(turns)))
+
+def catalog_latencies(catalog_tool, turns: int):
+    # Time until each turn's catalog result is available, while web searches are in flight
+    async def timed_catalog():
+        start = time.perf_counter()
+        await catalog_tool.ainvoke({"query": QUERY})
+        return (time.perf_counter() - start) * 1000
+
+    async def scenario(market_tool):
+        calls = []
+        for _ in range(turns):
+            calls += [timed_catalog(), market_tool.ainvoke({"query": QUERY})]
+        results = await asyncio.gather(*calls)
+        return results[::2]
+    return scenario
+
+def summary(values) -> str:
+    return f"median {statistics.median(values):6.0f} ms | max {max(values):6.0f} ms"
+
+def main():
+    tools.vector_store_manager = StubVectorStore()
+    tools.GoogleSerperAPIWrapper = StubSerper
+    print(f"CPU count: {os.cpu_count()} (default executor: {min(32, (os.cpu_count() or 1) + 4)} threads), "
+          f"tool pool: {tool_executor.max_workers} threads per tool")
+
+    # 1. Single turn
+    before = [asyncio.run(one_turn(old_search_catalog_tool, old_market_research_tool))[0] for _ in range(RUNS)]
+    after = [asyncio.run(one_turn(tools.search_catalog_tool, tools.market_research_tool))[0] for _ in range(RUNS)]
+    print(f"\n1. One turn, search_catalog_tool + market_research_tool ({RUNS} runs)")
+    print(f"   Before: {summary(before)}")
+    print(f"   After:  {summary(after)}")
+
+    # 2. Concurrent turns
+    before = [t for t, _ in asyncio.run(many_turns(old_search_catalog_tool, old_market_research_tool, CONCURRENT_TURNS))]
+    after = [t for t, _ in asyncio.run(many_turns(tools.search_catalog_tool, tools.market_research_tool, CONCURRENT_TURNS))]
+    print(f"\n2. {CONCURRENT_TURNS} concurrent turns, same tool pair (turn latency)")
+    print(f"   Before: {summary(before)}")
+    print(f"   After:  {summary(after)}")
+
+    # 3. Hung Serper: catalog latency while every web search hangs
+    StubSerper.latency = HUNG_SERPER_LATENCY
+    tool_executor.timeouts["market_research_tool"] = HUNG_SERPER_TIMEOUT
+    scenario = catalog_latencies(old_search_catalog_tool, CONCURRENT_TURNS)
+    before = asyncio.run(scenario(old_market_research_tool))
+    scenario = catalog_latencies(tools.search_catalog_tool, CONCURRENT_TURNS)
+    after = asyncio.run(scenario(tools.market_research_tool))
+    print(f"\n3. {CONCURRENT_TURNS} concurrent turns, Serper hangs {HUNG_SERPER_LATENCY:g}s "
+          f"(timeout {HUNG_SERPER_TIMEOUT:g}s) - search_catalog_tool latency")
+    print(f"   Before: {summary(before)}")
+    print(f"   After:  {summary(after)}")
+
+    _, (catalog, market) = asyncio.run(one_turn(tools.search_catalog_tool, tools.market_research_tool))
+    print(f"   Partial result: {len(json.loads(catalog))} catalog result(s), market_research_tool -> {json.loads(market)}")
+
+    print("\nTool metrics (after):")
+    print(json.dumps(tool_executor.get_metrics(), indent=2))
+    tool_executor.shutdown()
+
+if __name__ == "__main__":
+    main()